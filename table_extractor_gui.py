@@ -4,22 +4,42 @@
 import os
 import sys
 import re
+import csv
+import io
+import hashlib
+import html
+import importlib.util
+import threading
 import traceback
-from typing import List, Dict, Tuple, Optional
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from itertools import islice
+from typing import List, Dict, Tuple, Optional, Iterator, Sequence
 
+import numpy as np
 import pandas as pd
 
-# Optional PDF support
+# Optional PDF support; pdfplumber is imported on first PDF load (see require_pdfplumber)
+_pdfplumber = None
+
+# Optional PyArrow-backed dtypes (compact string storage, faster concat / str ops)
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Optional Rust-based Excel reader (pandas engine="calamine")
+HAS_CALAMINE = importlib.util.find_spec("python_calamine") is not None
+
+# Optional Aho-Corasick automaton for synonym matching
 try:
-    import pdfplumber
-    HAS_PDFPLUMBER = True
+    import ahocorasick
+    HAS_AHOCORASICK = True
 except Exception:
-    HAS_PDFPLUMBER = False
+    HAS_AHOCORASICK = False
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QGridLayout, QLabel, QLineEdit, QPushButton,
-    QFileDialog, QListWidget, QListWidgetItem, QCheckBox, QTableWidget, QTableWidgetItem,
+    QFileDialog, QListWidget, QListWidgetItem, QCheckBox, QTableView,
     QHeaderView, QMessageBox, QGroupBox, QHBoxLayout, QVBoxLayout, QComboBox, QSpinBox, QTextEdit
 )
 
@@ -35,10 +55,41 @@ STATE_SYNS = ["state", "state/province", "state_province", "st", "state_code", "
 
 ADDRESS_SYNS = ["address", "full address", "addr", "location", "site"]
 
-def load_tables(path: str) -> List[pd.DataFrame]:
+# Lower-cased, stripped synonyms, computed once for find_col / match_synonyms
+_CITY_LOWER = tuple(s.strip().lower() for s in CITY_SYNS)
+_REGION_LOWER = tuple(s.strip().lower() for s in REGION_SYNS)
+_STATE_LOWER = tuple(s.strip().lower() for s in STATE_SYNS)
+_ADDRESS_LOWER = tuple(s.strip().lower() for s in ADDRESS_SYNS)
+
+# Very simple address regex: "... City, ST 12345" or "... City, ST"
+# (the character classes are already case-agnostic, so no IGNORECASE flag is needed)
+_ADDR_RE = re.compile(r"(?P<city>[^,]+),\s*(?P<state>[A-Za-z]{2})(?:\s+\d{4,6})?")
+
+# pd.concat(copy=False) skips a copy on pandas 2 (the pinned version); pandas 3 never copies
+# there (copy-on-write) and warns about the keyword
+CONCAT_NO_COPY = {"copy": False} if int(pd.__version__.split(".")[0]) < 3 else {}
+
+# Parsed PDF tables are cached here, keyed by a hash of the file contents
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "table_extractor")
+# Bump when the parsed-table format changes (table_to_df, dtypes) so old pickles are not served
+PDF_CACHE_VERSION = 2
+PDF_CACHE_MAX_BYTES = 500 * 1024 * 1024
+# Pages each PDF worker parses per open; shorter documents are parsed in-process
+PDF_PAGES_PER_TASK = 8
+
+def load_tables(path: str, pages: Optional[List[int]] = None, force_refresh: bool = False) -> List[pd.DataFrame]:
     """
     Load one or more tables from CSV / Excel / HTML / PDF.
     Returns a list of DataFrames. May be length 1 for CSV/Excel.
+    `pages` (1-based page numbers) restricts PDF parsing to those pages.
+    `force_refresh` re-parses a PDF even if a cached result exists.
+    """
+    return list(iter_tables(path, pages=pages, force_refresh=force_refresh))
+
+def iter_tables(path: str, pages: Optional[List[int]] = None, force_refresh: bool = False) -> Iterator[pd.DataFrame]:
+    """
+    Lazily yield tables from CSV / Excel / HTML / PDF.
+    PDF pages are parsed one at a time, so callers can stop after the first table.
     """
     ext = os.path.splitext(path)[1].lower()
 
@@ -46,56 +97,263 @@ def load_tables(path: str) -> List[pd.DataFrame]:
         raise ValueError(f"Unsupported file type: {ext}")
 
     if ext == ".csv":
-        df = pd.read_csv(path)
-        return [df]
+        yield read_csv_table(path)
+        return
 
     if ext in {".xlsx", ".xls"}:
-        # Read first sheet by default; if you want all sheets, change to sheet_name=None
-        return [pd.read_excel(path)]
+        yield read_excel_table(path)
+        return
 
     if ext in {".html", ".htm"}:
         dfs = pd.read_html(path)
         if not dfs:
             raise ValueError("No tables found in HTML.")
-        return dfs
+        for df in dfs:
+            yield to_arrow_dtypes(df)
+        return
 
     if ext == ".pdf":
-        if not HAS_PDFPLUMBER:
-            raise RuntimeError("pdfplumber is not installed. Please `pip install pdfplumber`.")
-        dfs: List[pd.DataFrame] = []
-        with pdfplumber.open(path) as pdf:
-            for page in pdf.pages:
-                tables = page.extract_tables()
-                for t in tables or []:
-                    # Convert the raw table (list of rows) into a DataFrame
-                    # Use the first non-empty row as header if possible
-                    rows = [r if r is not None else [] for r in t]
-                    if not rows:
-                        continue
-                    # Heuristic: find first row that looks like a header (no None-only rows)
-                    header_idx = 0
-                    for i, r in enumerate(rows[:3]):  # look at first few rows
-                        if any(cell not in [None, ""] for cell in r):
-                            header_idx = i
-                            break
-                    header = [clean_header(x) for x in rows[header_idx]]
-                    data_rows = rows[header_idx + 1 :]
-                    df = pd.DataFrame(data_rows, columns=normalize_header_len(header, data_rows))
-                    dfs.append(df)
-        if not dfs:
-            raise ValueError("No tables found in PDF.")
-        return dfs
+        yield from iter_pdf_tables(path, pages=pages, force_refresh=force_refresh)
+        return
 
     raise ValueError(f"Unhandled extension: {ext}")
 
+def require_pdfplumber():
+    """
+    Import pdfplumber on first use so CSV / Excel / HTML users don't pay for it at startup.
+    """
+    global _pdfplumber
+    if _pdfplumber is None:
+        try:
+            import pdfplumber
+        except ImportError:
+            raise RuntimeError("pdfplumber is not installed. Please `pip install pdfplumber`.")
+        _pdfplumber = pdfplumber
+    return _pdfplumber
+
+def iter_pdf_tables(path: str, pages: Optional[List[int]] = None, force_refresh: bool = False) -> Iterator[pd.DataFrame]:
+    """
+    Yield one DataFrame per table, in page order, as pages finish parsing.
+    Parsing stops when the generator is exhausted or closed (see iter_pdf_page_tables).
+    Results are cached on disk by content hash once every page has been parsed.
+    """
+    tables, pending = open_pdf_tables(path, pages=pages, force_refresh=force_refresh)
+    yield from tables
+    if pending is not None:
+        yield from pending
+
+def open_pdf_tables(path: str, pages: Optional[List[int]] = None, force_refresh: bool = False) -> Tuple[List[pd.DataFrame], Optional[Iterator[pd.DataFrame]]]:
+    """
+    Return (tables_read_so_far, iterator_over_remaining_tables_or_None).
+    A cache hit returns every table and no iterator; otherwise parsing stops after the first table.
+    """
+    cache_path = pdf_cache_path(path, pages)
+    cached = None if force_refresh else read_pdf_cache(cache_path)
+    if cached:
+        return cached, None
+    pending = parse_pdf_tables(path, pages, cache_path)
+    return [next(pending)], pending
+
+def read_pdf_cache(cache_path: str) -> Optional[List[pd.DataFrame]]:
+    """
+    Tables cached by a previous parse, or None if there is no usable cache entry.
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        return pd.read_pickle(cache_path) or None
+    except Exception:
+        return None  # unreadable cache entry; parse again
+
+def parse_pdf_tables(path: str, pages: Optional[List[int]], cache_path: str) -> Iterator[pd.DataFrame]:
+    """
+    Parse the PDF (no cache lookup), yielding tables as pages finish, then write the cache.
+    """
+    dfs: List[pd.DataFrame] = []
+    for tables in iter_pdf_page_tables(path, pages):
+        for t in tables:
+            df = table_to_df(t)
+            if df is None:
+                continue
+            dfs.append(df)
+            yield df
+    if not dfs:
+        raise ValueError("No tables found in PDF.")
+    write_pdf_cache(cache_path, dfs)
+
+def parse_pdf_pages(path: str, page_numbers: List[int]) -> List[List[List[List[Optional[str]]]]]:
+    """
+    Extract the raw tables (lists of rows) of each given 1-based page, opening the PDF once.
+    Runs in a worker process.
+    """
+    with require_pdfplumber().open(path, pages=page_numbers) as pdf:
+        return [page.extract_tables() or [] for page in pdf.pages]
+
+def iter_pdf_page_tables(path: str, pages: Optional[List[int]] = None) -> Iterator[List[List[List[Optional[str]]]]]:
+    """
+    Yield each page's raw tables in page order.
+    The first page is parsed in-process so the first table shows up without waiting for
+    worker start-up. On a multi-core machine a long document's remaining pages go to worker
+    processes in runs of PDF_PAGES_PER_TASK; only a couple of runs per worker are queued
+    ahead of the caller, so a generator that is paused (or closed) early stops parsing.
+    """
+    with require_pdfplumber().open(path, pages=pages) as pdf:
+        if not pdf.pages:
+            return
+        yield pdf.pages[0].extract_tables() or []
+        rest = pdf.pages[1:]
+        workers = min(os.cpu_count() or 1, -(-len(rest) // PDF_PAGES_PER_TASK))
+        if workers <= 1:
+            # Worker start-up (each re-imports Qt and pandas) would cost more than it saves
+            for page in rest:
+                yield page.extract_tables() or []
+            return
+        runs = [[page.page_number for page in rest[i : i + PDF_PAGES_PER_TASK]]
+                for i in range(0, len(rest), PDF_PAGES_PER_TASK)]
+    # spawn: forking a process that runs Qt threads is unsafe
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        queued = deque()
+        todo = iter(runs)
+        for run in islice(todo, 2 * workers):
+            queued.append(executor.submit(parse_pdf_pages, path, run))
+        while queued:
+            run_tables = queued.popleft().result()
+            for run in islice(todo, 1):
+                queued.append(executor.submit(parse_pdf_pages, path, run))
+            yield from run_tables
+    finally:
+        # If the caller stops early (e.g. another file is loaded), drop the runs not started yet
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def table_to_df(t: List[List[Optional[str]]]) -> Optional[pd.DataFrame]:
+    """
+    Convert a raw pdfplumber table (list of rows) into a DataFrame.
+    Uses the first non-empty row as header if possible.
+    """
+    rows = [r if r is not None else [] for r in t]
+    if not rows:
+        return None
+    arr = np.array(rows, dtype=object)
+    ragged = arr.ndim != 2
+    if ragged:
+        # Pad to the widest row with None
+        arr = np.full((len(rows), max(map(len, rows))), None, dtype=object)
+        for i, r in enumerate(rows):
+            arr[i, : len(r)] = r
+    # Heuristic: header is the first of the first few rows with any non-empty cell
+    filled = np.not_equal(arr, None) & np.not_equal(arr, "")
+    header_idx = int(np.argmax(filled.any(axis=1)[:3]))
+    width = max(map(len, rows[header_idx:])) if ragged else arr.shape[1]
+    if width == 0:
+        return None
+    arr = arr[header_idx:, :width]
+    header = [clean_header(x) for x in arr[0]]
+    return pd.DataFrame(
+        arr[1:],
+        columns=normalize_header_len(header, width),
+        dtype="string[pyarrow]" if HAS_PYARROW else None,
+    )
+
+def read_csv_table(path: str) -> pd.DataFrame:
+    """
+    Read a CSV with pyarrow's multi-threaded parser when available, else pandas' C parser.
+    Files where the two parsers would disagree are read with the C parser.
+    """
+    if HAS_PYARROW:
+        import pyarrow as pa
+
+        try:
+            df = pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow")
+        except ValueError:
+            df = None  # pyarrow is stricter than the C parser (e.g. ragged rows); retry below
+        # pyarrow keeps repeated header names (no 'City.1') and turns date / time text into
+        # temporal types that export differently; the C parser leaves both as read
+        if df is not None and not df.columns.duplicated().any() and not any(
+            isinstance(t, pd.ArrowDtype) and pa.types.is_temporal(t.pyarrow_dtype) for t in df.dtypes
+        ):
+            return df
+    return to_arrow_dtypes(pd.read_csv(path))
+
+def read_excel_table(path: str) -> pd.DataFrame:
+    """
+    Read the first sheet with the calamine engine when available, else pandas' default engine.
+    """
+    # Read first sheet by default; if you want all sheets, change to sheet_name=None
+    if HAS_CALAMINE:
+        try:
+            return to_arrow_dtypes(pd.read_excel(path, engine="calamine"))
+        except (ImportError, ValueError):
+            pass  # e.g. pandas too old for engine="calamine"; retry below
+    return to_arrow_dtypes(pd.read_excel(path))
+
+def to_arrow_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Switch columns to PyArrow-backed dtypes when pyarrow is installed; missing values become pd.NA.
+    """
+    if not HAS_PYARROW:
+        return df
+    return df.convert_dtypes(dtype_backend="pyarrow")
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    SHA-256 of a file's contents, read in chunks so large files are not loaded whole.
+    """
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def pdf_cache_path(path: str, pages: Optional[List[int]] = None) -> str:
+    key = f"v{PDF_CACHE_VERSION}_{file_digest(path)}"
+    if pages:
+        key += "_p" + "-".join(str(p) for p in pages)
+    return os.path.join(CACHE_DIR, f"{key}.pkl")
+
+def write_pdf_cache(cache_path: str, dfs: List[pd.DataFrame]):
+    """
+    Best-effort cache write; a failure here must never break loading.
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        pd.to_pickle(dfs, tmp_path)
+        os.replace(tmp_path, cache_path)
+        prune_pdf_cache(keep=cache_path)
+    except Exception:
+        pass
+
+def prune_pdf_cache(keep: str, max_bytes: int = PDF_CACHE_MAX_BYTES):
+    """
+    Delete cache entries from other versions, then the least recently written ones
+    until the cache fits in max_bytes. `keep` (the entry just written) is never deleted.
+    """
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        full = os.path.join(CACHE_DIR, name)
+        if full == keep or not name.endswith(".pkl"):
+            continue
+        if not name.startswith(f"v{PDF_CACHE_VERSION}_"):
+            os.remove(full)
+            continue
+        st = os.stat(full)
+        entries.append((st.st_mtime, st.st_size, full))
+    total = os.path.getsize(keep) + sum(size for _, size, _ in entries)
+    for _, size, full in sorted(entries):
+        if total <= max_bytes:
+            break
+        os.remove(full)
+        total -= size
+
 def clean_header(x) -> str:
     return str(x).strip() if x is not None else ""
 
-def normalize_header_len(header: List[str], data_rows: List[List[str]]) -> List[str]:
+def normalize_header_len(header: List[str], width: int) -> List[str]:
     """
-    Make sure header length matches the widest data row.
+    Make sure header length matches the table width (widest row).
     """
-    max_cols = max([len(header)] + [len(r) for r in data_rows] + [1])
+    max_cols = max(len(header), width, 1)
     new_header = header[:]
     if len(new_header) < max_cols:
         new_header += [f"col_{i+1}" for i in range(len(new_header), max_cols)]
@@ -126,13 +384,15 @@ def normalize_cols(df: pd.DataFrame) -> Dict[str, str]:
         mapping[str(c).strip().lower()] = c
     return mapping
 
-def find_col(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
+def find_col(df: pd.DataFrame, candidates: Sequence[str], cmap: Optional[Dict[str, str]] = None) -> Optional[str]:
     """
     Find a column by synonyms (case-insensitive).
+    `candidates` must already be stripped and lower-cased (e.g. _CITY_LOWER).
+    Pass `cmap` (normalize_cols(df)) to reuse one column map across several lookups.
     """
-    cmap = normalize_cols(df)
-    for cand in candidates:
-        key = cand.strip().lower()
+    if cmap is None:
+        cmap = normalize_cols(df)
+    for key in candidates:
         if key in cmap:
             return cmap[key]
     # Try loose contains (e.g., "City Name")
@@ -142,34 +402,67 @@ def find_col(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
                 return original
     return None
 
-CITY_CANDS = CITY_SYNS
-REGION_CANDS = REGION_SYNS
-STATE_CANDS = STATE_SYNS
+CITY_CANDS = _CITY_LOWER
+REGION_CANDS = _REGION_LOWER
+STATE_CANDS = _STATE_LOWER
+
+SYNONYMS = {"City": CITY_CANDS, "Region": REGION_CANDS, "State": STATE_CANDS, "Address": _ADDRESS_LOWER}
 
-def address_fallback(df: pd.DataFrame) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+def build_synonym_matcher():
+    """
+    Build one automaton over every synonym; each word maps to the set of kinds it belongs to
+    (e.g. "province" is both a Region and a State synonym).
+    """
+    kinds_by_syn: Dict[str, set] = {}
+    for kind, syns in SYNONYMS.items():
+        for syn in syns:
+            kinds_by_syn.setdefault(syn, set()).add(kind)
+    automaton = ahocorasick.Automaton()
+    for syn, kinds in kinds_by_syn.items():
+        automaton.add_word(syn, frozenset(kinds))
+    automaton.make_automaton()
+    return automaton
+
+SYNONYM_MATCHER = build_synonym_matcher() if HAS_AHOCORASICK else None
+
+def match_synonyms(df: pd.DataFrame, cmap: Optional[Dict[str, str]] = None) -> Dict[str, Optional[str]]:
+    """
+    Resolve a column for every kind in SYNONYMS, same result as find_col per kind.
+    Exact synonym matches win; otherwise the first column whose name contains a synonym,
+    found with a single automaton scan per column name.
+    """
+    if cmap is None:
+        cmap = normalize_cols(df)
+    if SYNONYM_MATCHER is None:
+        return {kind: find_col(df, syns, cmap) for kind, syns in SYNONYMS.items()}
+    found: Dict[str, Optional[str]] = {}
+    for kind, syns in SYNONYMS.items():
+        found[kind] = next((cmap[k] for k in syns if k in cmap), None)
+    # Loose contains (e.g., "City Name") for the kinds still unresolved
+    missing = {kind for kind, col in found.items() if col is None}
+    for key, original in cmap.items():
+        if not missing:
+            break
+        for _, kinds in SYNONYM_MATCHER.iter(key):
+            for kind in kinds & missing:
+                found[kind] = original
+            missing -= kinds
+    return found
+
+def address_fallback(df: pd.DataFrame, addr_col: Optional[str] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     If City/State not found, try to parse from an address-like column:
     pattern: 'City, ST 12345' (US-style)
     Returns (city_col, state_col, region_col) as *synthetic* names created during extraction.
     """
-    addr_col = find_col(df, ADDRESS_SYNS)
+    if addr_col is None:
+        addr_col = find_col(df, _ADDRESS_LOWER)
     if not addr_col:
         return (None, None, None)
     # We'll create two new columns by parsing Address
-    city_vals = []
-    state_vals = []
-    # Very simple regex: "... City, ST 12345" or "... City, ST"
-    pattern = re.compile(r"(?P<city>[^,]+),\s*(?P<state>[A-Za-z]{2})(?:\s+\d{4,6})?", re.IGNORECASE)
-    for v in df[addr_col].astype(str).fillna(""):
-        m = pattern.search(v)
-        if m:
-            city_vals.append(m.group("city").strip())
-            state_vals.append(m.group("state").upper())
-        else:
-            city_vals.append("")
-            state_vals.append("")
-    df["__parsed_city"] = city_vals
-    df["__parsed_state"] = state_vals
+    extracted = df[addr_col].astype(str).str.extract(_ADDR_RE.pattern, expand=True)
+    df["__parsed_city"] = extracted["city"].str.strip().fillna("")
+    df["__parsed_state"] = extracted["state"].str.upper().fillna("")
     return ("__parsed_city", "__parsed_state", None)  # region not parsed
 
 def suggest_mappings(df: pd.DataFrame) -> Dict[str, Optional[str]]:
@@ -177,11 +470,10 @@ def suggest_mappings(df: pd.DataFrame) -> Dict[str, Optional[str]]:
     Suggest columns for City / Region / State using synonyms,
     with Address fallback if needed.
     """
-    city = find_col(df, CITY_CANDS)
-    region = find_col(df, REGION_CANDS)
-    state = find_col(df, STATE_CANDS)
+    found = match_synonyms(df)
+    city, region, state = found["City"], found["Region"], found["State"]
     if not city or not state:
-        c2, s2, _ = address_fallback(df)
+        c2, s2, _ = address_fallback(df, found["Address"])
         city = city or c2
         state = state or s2
     return {"City": city, "Region": region, "State": state}
@@ -195,32 +487,152 @@ def extract_columns(dfs: List[pd.DataFrame], chosen_cols: List[str]) -> pd.DataF
     Concatenate selected columns from all tables (align by selected names).
     Missing columns are filled with empty strings.
     """
-    out_frames = []
+    chosen_cols = list(dict.fromkeys(chosen_cols))  # a name picked twice is output once
+    if not dfs:
+        return pd.DataFrame(columns=chosen_cols)
+    frames = []
     for df in dfs:
         available = {str(c): c for c in df.columns}
-        subset = {}
+        lowered: Dict[str, object] = {}
+        for k, v in available.items():
+            lowered.setdefault(k.strip().lower(), v)
+        # find by exact, or case-insensitive
+        matched = {}
         for name in chosen_cols:
-            # find by exact, or case-insensitive
             col = available.get(name)
             if col is None:
-                # try case-insensitive
-                for k, v in available.items():
-                    if k.strip().lower() == name.strip().lower():
-                        col = v
-                        break
+                col = lowered.get(name.strip().lower())
             if col is not None:
-                subset[name] = df[col]
-            else:
-                subset[name] = [""] * len(df)
-        out_frames.append(pd.DataFrame(subset))
-    if not out_frames:
-        return pd.DataFrame(columns=chosen_cols)
-    return pd.concat(out_frames, ignore_index=True)
+                matched[name] = col
+        # Select by position (labels may repeat), rename to the chosen names,
+        # and let reindex add the missing ones filled with ""
+        position = {str(c): i for i, c in enumerate(df.columns)}
+        picked = df.iloc[:, [position[str(col)] for col in matched.values()]].set_axis(list(matched), axis=1)
+        frames.append(picked.reindex(columns=chosen_cols, fill_value=""))
+    return pd.concat(frames, ignore_index=True, **CONCAT_NO_COPY)
+
+def export_csv(df: pd.DataFrame, out_path: str):
+    """
+    Write df to CSV in pandas' to_csv format (minimal quoting, missing values as empty cells).
+    All-text frames whose values need no quoting go through pyarrow's C++ writer;
+    everything else is streamed through pandas in chunks to cap memory.
+    """
+    # pyarrow formats numbers / booleans differently, and a lone empty field must be quoted
+    if HAS_PYARROW and len(df.columns) > 1 and all(pd.api.types.is_string_dtype(t) for t in df.dtypes):
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        try:
+            schema = pa.schema([(str(c), pa.string()) for c in df.columns])
+            table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            header = io.StringIO()
+            csv.writer(header, lineterminator="\n").writerow(df.columns)
+            with open(out_path, "wb") as f:
+                f.write(header.getvalue().encode("utf-8"))
+                pacsv.write_csv(table, f, pacsv.WriteOptions(include_header=False, quoting_style="none"))
+            return
+        except (TypeError, ValueError):
+            pass  # e.g. object columns holding numbers, or values with commas / quotes / newlines
+    df.to_csv(out_path, index=False, chunksize=50_000, lineterminator="\n")
+
+def open_first_table(path: str, force_refresh: bool = False):
+    """
+    Read the tables of `path` for the Load button.
+    Sources that are read whole anyway (CSV, Excel, HTML, cached PDFs) come back complete;
+    an uncached PDF is parsed only up to its first table and the rest is left pending.
+    Returns (tables, iterator_over_remaining_tables_or_None, suggested_mappings).
+    """
+    if os.path.splitext(path)[1].lower() == ".pdf":
+        tables, pending = open_pdf_tables(path, force_refresh=force_refresh)
+    else:
+        tables, pending = load_tables(path), None
+    return tables, pending, suggest_mappings(tables[0].copy())
+
+def extract_all(tables: List[pd.DataFrame],
+                pending: Optional[Iterator[pd.DataFrame]],
+                chosen_cols: List[str],
+                cancel: Optional[threading.Event] = None,
+                report=None):
+    """
+    Read any tables still pending, then extract the chosen columns from all of them.
+    `report`, if given, is called with each pending table as soon as it is read.
+    Setting `cancel` stops reading pending tables (and closes them) between tables.
+    Returns (newly_read_tables, extracted_df).
+    """
+    rest = []
+    for df in pending if pending is not None else ():
+        if cancel is not None and cancel.is_set():
+            pending.close()
+            return rest, pd.DataFrame(columns=chosen_cols)
+        rest.append(df)
+        if report is not None:
+            report(df)
+    return rest, extract_columns(tables + rest, chosen_cols)
 
 # -----------------------------------------
 # GUI
 # -----------------------------------------
 
+def log_html(text: str) -> str:
+    """
+    Escape a log message for the rich-text log, keeping its line breaks.
+    """
+    return html.escape(text, quote=False).replace("\n", "<br>")
+
+class JobSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str, str)  # (title, message)
+    progress = pyqtSignal(object)
+
+class Job(QRunnable):
+    """
+    Run fn(*args) on a QThreadPool thread. The result (or the formatted error)
+    is delivered back on the GUI thread through self.signals.
+    With report=True, fn also gets a report= callback that emits signals.progress.
+    """
+    def __init__(self, error_title: str, fn, *args, report: bool = False):
+        super().__init__()
+        self.error_title = error_title
+        self.fn = fn
+        self.args = args
+        self.signals = JobSignals()
+        self.kwargs = {"report": self.signals.progress.emit} if report else {}
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.error_title, f"{e}\n\n{traceback.format_exc()}")
+        else:
+            self.signals.finished.emit(result)
+
+class PandasModel(QAbstractTableModel):
+    """
+    Read-only table model over a DataFrame; the view only asks for visible cells.
+    """
+    def __init__(self, df: pd.DataFrame, parent=None):
+        super().__init__(parent)
+        self._df = df
+        # Convert every cell to display text once, vectorized, instead of per data() call
+        self._text = df.astype(object).where(df.notna(), "").astype(str).to_numpy()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df.columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._text[index.row(), index.column()]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
+
 class ExtractorWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -228,7 +640,17 @@ class ExtractorWindow(QMainWindow):
         self.setMinimumSize(1000, 650)
 
         self.all_tables: List[pd.DataFrame] = []
+        self.pending_tables: Optional[Iterator[pd.DataFrame]] = None
+        self.seen_cols: set = set()
         self.loaded_path: Optional[str] = None
+        # Paths of the load / export job in flight, reported when it finishes
+        self.loading_path: Optional[str] = None
+        self.export_path: Optional[str] = None
+
+        # Loading / extraction / export run off the GUI thread
+        self.threadpool = QThreadPool.globalInstance()
+        # Set on close so a running extraction stops parsing PDF pages
+        self.closing = threading.Event()
 
         # Widgets
         main = QWidget()
@@ -242,14 +664,16 @@ class ExtractorWindow(QMainWindow):
         self.path_edit.setPlaceholderText("Select a CSV, Excel, HTML, or PDF file...")
         btn_browse = QPushButton("Browse...")
         btn_browse.clicked.connect(self.on_browse)
-        btn_load = QPushButton("Load")
-        btn_load.clicked.connect(self.on_load)
+        self.btn_load = QPushButton("Load")
+        self.btn_load.clicked.connect(self.on_load)
+        self.chk_refresh = QCheckBox("Re-parse PDF (ignore cache)")
 
         file_row = QHBoxLayout()
         file_row.addWidget(QLabel("Input file:"))
         file_row.addWidget(self.path_edit, stretch=1)
         file_row.addWidget(btn_browse)
-        file_row.addWidget(btn_load)
+        file_row.addWidget(self.chk_refresh)
+        file_row.addWidget(self.btn_load)
         grid.addLayout(file_row, 0, 0, 1, 2)
 
         # Column chooser group
@@ -285,15 +709,15 @@ class ExtractorWindow(QMainWindow):
         right_layout = QVBoxLayout()
         right_box.setLayout(right_layout)
 
-        self.table = QTableWidget()
+        self.table = QTableView()
         self.table.setEditTriggers(self.table.EditTrigger.NoEditTriggers)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         right_layout.addWidget(self.table, stretch=1)
 
-        btn_extract = QPushButton("Extract & Preview")
-        btn_extract.clicked.connect(self.on_extract)
-        right_layout.addWidget(btn_extract)
+        self.btn_extract = QPushButton("Extract & Preview")
+        self.btn_extract.clicked.connect(self.on_extract)
+        right_layout.addWidget(self.btn_extract)
 
         # Save row
         save_row = QHBoxLayout()
@@ -301,11 +725,11 @@ class ExtractorWindow(QMainWindow):
         self.save_edit.setPlaceholderText("Output CSV path (e.g., C:\\Temp\\extracted.csv)")
         btn_save_browse = QPushButton("Save As...")
         btn_save_browse.clicked.connect(self.on_save_browse)
-        btn_export = QPushButton("Export CSV")
-        btn_export.clicked.connect(self.on_export)
+        self.btn_export = QPushButton("Export CSV")
+        self.btn_export.clicked.connect(self.on_export)
         save_row.addWidget(self.save_edit, stretch=1)
         save_row.addWidget(btn_save_browse)
-        save_row.addWidget(btn_export)
+        save_row.addWidget(self.btn_export)
 
         right_layout.addLayout(save_row)
 
@@ -314,6 +738,8 @@ class ExtractorWindow(QMainWindow):
         # Logger / status
         self.log = QTextEdit()
         self.log.setReadOnly(True)
+        # Messages are batched and appended on a short timer (see _flush_log)
+        self._log_buf: List[str] = []
         grid.addWidget(self.log, 2, 0, 1, 2)
 
         self.setCentralWidget(main)
@@ -338,26 +764,60 @@ class ExtractorWindow(QMainWindow):
         if not os.path.exists(path):
             self.msg(f"File does not exist: {path}")
             return
-        try:
-            self.log_info(f"Loading tables from {path} ...")
-            self.all_tables = load_tables(path)
-            self.loaded_path = path
-            self.log_info(f"Loaded {len(self.all_tables)} table(s).")
-            # Build a combined column set
-            all_cols = []
-            for df in self.all_tables:
-                all_cols.extend([str(c) for c in df.columns])
-            unique_cols = sorted(list(dict.fromkeys(all_cols)))
-            self.update_columns_ui(unique_cols)
-            # Suggest mappings based on first table with any columns
-            if self.all_tables:
-                sug = suggest_mappings(self.all_tables[0].copy())
-                self.set_combo_selection(self.cmb_city, sug.get("City"))
-                self.set_combo_selection(self.cmb_region, sug.get("Region"))
-                self.set_combo_selection(self.cmb_state, sug.get("State"))
-            self.log_info("Ready. Pick columns and click 'Extract & Preview'.")
-        except Exception as e:
-            self.error_box("Load Error", f"{e}\n\n{traceback.format_exc()}")
+        self.log_info(f"Loading tables from {path} ...")
+        # The current file stays loaded (pending tables included) until the new one succeeds
+        self.loading_path = path
+        # An uncached PDF is only parsed up to its first table now; the rest is pulled on Extract
+        self.start_job(Job("Load Error", open_first_table, path, self.chk_refresh.isChecked()), self.on_loaded)
+
+    def on_loaded(self, result):
+        tables, pending, sug = result
+        self.set_busy(False)
+        self.close_pending()
+        self.all_tables = list(tables)
+        self.pending_tables = pending
+        self.loaded_path = self.loading_path
+        if pending is None:
+            self.log_info(f"Loaded {len(tables)} table(s).")
+        else:
+            self.log_info("Loaded first PDF table; the remaining pages are parsed on Extract.")
+        # Build a combined column set (in order of first appearance)
+        self.seen_cols = set()
+        self.update_columns_ui(self.collect_new_columns(self.all_tables))
+        # Suggest mappings based on the first table
+        self.set_combo_selection(self.cmb_city, sug.get("City"))
+        self.set_combo_selection(self.cmb_region, sug.get("Region"))
+        self.set_combo_selection(self.cmb_state, sug.get("State"))
+        self.log_info("Ready. Pick columns and click 'Extract & Preview'.")
+
+    def closeEvent(self, event):
+        # Stop PDF parsing so worker processes don't keep the app alive after the window closes,
+        # then let the running job (at most one more page) finish before Qt tears down its signals
+        self.closing.set()
+        self.close_pending()
+        self.threadpool.waitForDone()
+        super().closeEvent(event)
+
+    def close_pending(self):
+        """
+        Drop any tables still waiting to be parsed (closes the open PDF).
+        """
+        if self.pending_tables is not None:
+            self.pending_tables.close()
+            self.pending_tables = None
+
+    def collect_new_columns(self, dfs: List[pd.DataFrame]) -> List[str]:
+        """
+        Return column names not seen before in this file, in encounter order.
+        """
+        new_cols = []
+        for df in dfs:
+            for c in df.columns:
+                name = str(c)
+                if name not in self.seen_cols:
+                    self.seen_cols.add(name)
+                    new_cols.append(name)
+        return new_cols
 
     def on_extract(self):
         if not self.all_tables:
@@ -389,14 +849,36 @@ class ExtractorWindow(QMainWindow):
             self.msg("Please choose at least one column to extract.")
             return
 
-        try:
-            self.log_info(f"Extracting columns: {', '.join(chosen)}")
-            df = extract_columns(self.all_tables, chosen)
-            self.extracted_df = df
-            self.populate_preview(df.head(50))
-            self.log_info(f"Extracted {len(df)} rows.")
-        except Exception as e:
-            self.error_box("Extraction Error", f"{e}\n\n{traceback.format_exc()}")
+        self.log_info(f"Extracting columns: {', '.join(chosen)}")
+        # The job drains the pending tables; they are added to all_tables in on_extracted
+        pending, self.pending_tables = self.pending_tables, None
+        job = Job("Extraction Error", extract_all, list(self.all_tables), pending, chosen, self.closing, report=True)
+        job.signals.progress.connect(self.on_table_read)
+        self.start_job(job, self.on_extracted, self.on_extract_failed if pending is not None else None)
+
+    def on_table_read(self, df):
+        # Offer a pending table's columns in the pickers as soon as it is parsed
+        self.add_columns_ui(self.collect_new_columns([df]))
+
+    def on_extracted(self, result):
+        rest, df = result
+        self.set_busy(False)
+        if rest:
+            self.all_tables.extend(rest)
+            self.log_info(f"Loaded {len(self.all_tables)} table(s) in total.")
+        self.extracted_df = df
+        self.populate_preview(df.head(50))
+        self.log_info(f"Extracted {len(df)} rows.")
+
+    def on_extract_failed(self, title: str, text: str):
+        # The failed job consumed the pending tables, so the loaded file is now incomplete;
+        # drop it rather than let the next Extract silently use only part of it
+        self.all_tables = []
+        self.loaded_path = None
+        self.seen_cols = set()
+        self.update_columns_ui([])
+        self.on_job_failed(title, text)
+        self.log_error("The file is no longer loaded; please load it again.")
 
     def on_save_browse(self):
         path, _ = QFileDialog.getSaveFileName(
@@ -419,11 +901,33 @@ class ExtractorWindow(QMainWindow):
         try:
             # Ensure output directory exists
             os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-            self.extracted_df.to_csv(out_path, index=False)
-            self.log_info(f"Exported CSV to: {out_path}")
-            QMessageBox.information(self, "Done", f"Exported CSV to:\n{out_path}")
         except Exception as e:
             self.error_box("Export Error", f"{e}\n\n{traceback.format_exc()}")
+            return
+        self.export_path = out_path
+        self.start_job(Job("Export Error", export_csv, self.extracted_df, out_path), self.on_exported)
+
+    def on_exported(self, _result):
+        self.set_busy(False)
+        self.log_info(f"Exported CSV to: {self.export_path}")
+        QMessageBox.information(self, "Done", f"Exported CSV to:\n{self.export_path}")
+
+    # ---------------- Background jobs ----------------
+
+    def start_job(self, job: Job, on_done, on_failed=None):
+        self.set_busy(True)
+        job.signals.finished.connect(on_done)
+        job.signals.failed.connect(on_failed or self.on_job_failed)
+        self.threadpool.start(job)
+
+    def on_job_failed(self, title: str, text: str):
+        self.set_busy(False)
+        self.error_box(title, text)
+
+    def set_busy(self, busy: bool):
+        # Keep the user from starting a second job while one is running
+        for btn in (self.btn_load, self.btn_extract, self.btn_export):
+            btn.setEnabled(not busy)
 
     # ---------------- UI helpers ----------------
 
@@ -444,6 +948,14 @@ class ExtractorWindow(QMainWindow):
             item = QListWidgetItem(c)
             self.lst_other.addItem(item)
 
+    def add_columns_ui(self, columns: List[str]):
+        # Append columns discovered after load without touching current selections
+        for combo in (self.cmb_city, self.cmb_region, self.cmb_state):
+            for c in columns:
+                combo.addItem(c)
+        for c in columns:
+            self.lst_other.addItem(QListWidgetItem(c))
+
     def set_combo_selection(self, combo: QComboBox, value: Optional[str]):
         if not value:
             combo.setCurrentIndex(0)
@@ -459,15 +971,10 @@ class ExtractorWindow(QMainWindow):
             combo.setCurrentIndex(idx)
 
     def populate_preview(self, df: pd.DataFrame):
-        self.table.clear()
-        self.table.setRowCount(len(df))
-        self.table.setColumnCount(len(df.columns))
-        self.table.setHorizontalHeaderLabels([str(c) for c in df.columns])
-        for r in range(len(df)):
-            for c in range(len(df.columns)):
-                val = df.iat[r, c]
-                self.table.setItem(r, c, QTableWidgetItem("" if pd.isna(val) else str(val)))
-
+        old_model = self.table.model()
+        self.table.setModel(PandasModel(df, self.table))
+        if old_model is not None:
+            old_model.deleteLater()
         self.table.resizeColumnsToContents()
 
     def msg(self, text: str):
@@ -478,16 +985,30 @@ class ExtractorWindow(QMainWindow):
         self.log_error(text)
 
     def log_info(self, text: str):
-        self.log.append(f"✅ {text}")
+        # Every queued line is a tag, so QTextEdit.append always treats a flush as rich text
+        self.queue_log(f"<span>✅ {log_html(text)}</span>")
 
     def log_error(self, text: str):
-        self.log.append(f"<span style='color:#ff5555'>❌ {text}</span>")
+        self.queue_log(f"<span style='color:#ff5555'>❌ {log_html(text)}</span>")
+
+    def queue_log(self, line: str):
+        # One QTextEdit.append (and re-layout) per 100 ms instead of per message
+        self._log_buf.append(line)
+        if len(self._log_buf) == 1:
+            QTimer.singleShot(100, self._flush_log)
+
+    def _flush_log(self):
+        if self._log_buf:
+            self.log.append("<br>".join(self._log_buf))
+            self._log_buf.clear()
 
 # -----------------------------------------
 # Main
 # -----------------------------------------
 
 def main():
+    # PDF pages are parsed in worker processes; needed for the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     w = ExtractorWindow()
     w.show()
@@ -12,6 +12,9 @@ a = Analysis(
         'pandas',
         'openpyxl',
         'lxml',
+        'ahocorasick',
+        'pyarrow',
+        'python_calamine',
         'PyQt6',
     ],
     hookspath=[],